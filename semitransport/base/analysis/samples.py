@@ -2,6 +2,7 @@ from semitransport.base.analysis.transport_coefficients import\
     extract_transport_function, extract_effective_mass
 
 from os import listdir
+import re
 
 import numpy as np
 
@@ -9,6 +10,38 @@ import numpy as np
 this module abstracts experimental data into structured objects
 '''
 
+_data_file_pattern = re.compile(r'^(.+)_(conductivity|seebeck)\.csv$')
+
+
+def _load_data(filename):
+    '''
+    loads a data file with temperature (K) in the first column and a property
+    in the second column. lines with "#" are ignored and whitespace around the
+    comma delimiter is allowed
+
+    Args:
+        filename (str) path to the csv file
+
+    Returns: (ndarray) two column array of the data
+    '''
+    return np.loadtxt(filename, delimiter=',', usecols=(0, 1), ndmin=2)
+
+
+def _sort_by_first_col(data):
+    '''
+    sorts the rows of data by the first column, skipping the permutation if
+    the rows are already sorted (the common case for csv data)
+
+    Args:
+        data (ndarray) two column array of the data
+
+    Returns: (ndarray) the data sorted by the first column
+    '''
+    first_col = data[:, 0]
+    if (first_col[1:] >= first_col[:-1]).all():
+        return data
+    return data[first_col.argsort(kind='stable')]
+
 
 class Sample(object):
     '''
@@ -19,30 +52,58 @@ class Sample(object):
             temperature (K) and column two is conductivity (S/m)
         seebeck (ndarray) the Seebeck data. column one is the temperature (K)
             and column two is seebeck (V/K)
+        cond_T, cond_sigma (ndarray) contiguous temperature (K) and
+            conductivity (S/m) columns, sorted by temperature
+        seeb_T, seeb_S (ndarray) contiguous temperature (K) and Seebeck (V/K)
+            columns, sorted by temperature
         carrier_density (float) the carrier density (1/m^3)
         name (str) a unique identifier for this sample
     '''
     def __init__(self, conductivity=None, seebeck=None, name=None,
                  carrier_density=None):
-        # sorts conductivity and seebeck by temperature
-        self.conductivity = conductivity[conductivity[:, 0].argsort()]
-        self.seebeck = seebeck[seebeck[:, 0].argsort()]
+        # conductivity and seebeck are sorted by temperature on assignment
+        self.conductivity = conductivity
+        self.seebeck = seebeck
         # assigns name and carrier_density attributes
         self.name = name
         self.carrier_density = carrier_density
 
+    @property
+    def conductivity(self):
+        '''
+        conductivity data sorted by temperature
+        '''
+        return np.column_stack((self.cond_T, self.cond_sigma))
+
+    @conductivity.setter
+    def conductivity(self, conductivity):
+        conductivity = _sort_by_first_col(conductivity)
+        # copies so that the sample never shares memory with the caller
+        self.cond_T = np.array(conductivity[:, 0], copy=True)
+        self.cond_sigma = np.array(conductivity[:, 1], copy=True)
+
+    @property
+    def seebeck(self):
+        '''
+        Seebeck data sorted by temperature
+        '''
+        return np.column_stack((self.seeb_T, self.seeb_S))
+
+    @seebeck.setter
+    def seebeck(self, seebeck):
+        seebeck = _sort_by_first_col(seebeck)
+        # copies so that the sample never shares memory with the caller
+        self.seeb_T = np.array(seebeck[:, 0], copy=True)
+        self.seeb_S = np.array(seebeck[:, 1], copy=True)
+
     @property
     def temperature_window(self):
         '''
         touple of the overlapping temperature range in conductivity and Seebeck
         '''
-        conductivity_temperatures = self.conductivity[:, 0]
-        seebeck_temperatures = self.seebeck[:, 0]
-
-        minimum_permisable = max((min(conductivity_temperatures),
-                                  min(seebeck_temperatures)))
-        maximum_permisable = min((max(conductivity_temperatures),
-                                  max(seebeck_temperatures)))
+        # data is sorted by temperature, so the extrema are the end points
+        minimum_permisable = max(self.cond_T[0], self.seeb_T[0])
+        maximum_permisable = min(self.cond_T[-1], self.seeb_T[-1])
         return (minimum_permisable, maximum_permisable)
 
     def get_interpolated_data(self, n_temperatures=15):
@@ -56,11 +117,9 @@ class Sample(object):
         '''
         T_min, T_max = self.temperature_window
         temperatures = np.linspace(T_min, T_max, n_temperatures)
-        seebecks = np.interp(
-            x=temperatures, xp=self.seebeck[:, 0], fp=self.seebeck[:, 1])
+        seebecks = np.interp(x=temperatures, xp=self.seeb_T, fp=self.seeb_S)
         conductivities = np.interp(
-            x=temperatures, xp=self.conductivity[:, 0],
-            fp=self.conductivity[:, 1])
+            x=temperatures, xp=self.cond_T, fp=self.cond_sigma)
 
         return (temperatures, seebecks, conductivities)
 
@@ -83,17 +142,13 @@ class Sample(object):
             n_temperatures=n_temperatures)
 
         # extract the transport function
-        transport_functions = []
-        for seeb, cond, temp in zip(seebecks, conductivities, temperatures):
-            transport_functions.append(
-                extract_transport_function(seeb, cond, temp, s))
+        transport_functions = extract_transport_function(
+            seebecks, conductivities, temperatures, s)
 
         # extract the effective mass if carrier-density is known
         if self.carrier_density:
-            effective_masses = []
-            for seeb, temp in zip(seebecks, temperatures):
-                effective_masses.append(
-                    extract_effective_mass(seeb, self.carrier_density, temp))
+            effective_masses = extract_effective_mass(
+                seebecks, self.carrier_density, temperatures)
         else:
             effective_masses = None
 
@@ -112,10 +167,8 @@ class Sample(object):
             carrier_density (float) the carrier density in 1/m^3 if known
         '''
 
-        conductivity = np.loadtxt(
-            '{}/{}_conductivity.csv'.format(path, name), delimiter=', ')
-        seebeck = np.loadtxt(
-            '{}/{}_seebeck.csv'.format(path, name), delimiter=', ')
+        conductivity = _load_data('{}/{}_conductivity.csv'.format(path, name))
+        seebeck = _load_data('{}/{}_seebeck.csv'.format(path, name))
 
         return cls(conductivity=conductivity, seebeck=seebeck,
                    carrier_density=carrier_density, name=name)
@@ -146,8 +199,8 @@ class SampleSeries(object):
                 files should be in the same path
         '''
 
-        names = {
-            file.split('_')[0] for file in listdir(path) if '.csv' in file}
+        matches = (_data_file_pattern.match(file) for file in listdir(path))
+        names = {match.group(1) for match in matches if match}
 
         series = cls()
         for name in names:
@@ -173,8 +226,6 @@ class SampleSeries(object):
           - maximum value from the samples
         '''
 
-        trans_funcs = []
-        for seeb, cond in zip(seebecks, conductivities):
-            trans_funcs.append(
-                Sample.extract_transport_function(seeb, cond, temperature, s))
-        return (np.mean(trans_funcs), min(trans_funcs), max(trans_funcs))
+        trans_funcs = extract_transport_function(
+            np.asarray(seebecks), np.asarray(conductivities), temperature, s)
+        return (trans_funcs.mean(), trans_funcs.min(), trans_funcs.max())
@@ -1,9 +1,6 @@
 from semitransport.base.models.powerlaw_model import powerlaw_conductivity,\
     powerlaw_seebeck
-from semitransport.base.models.sphere_model import sphere_seebeck,\
-    sphere_carriers, constant
-
-from scipy.optimize import minimize
+from semitransport.base.models.sphere_model import sphere_carriers, constant
 
 import numpy as np
 
@@ -13,6 +10,35 @@ transport data (Seebeck, conductivity, etc.)
 '''
 
 _m_e = constant['m_e']
+_seebeck_tables = {}  # inverse Seebeck lookup tables keyed by s
+
+
+def _seebeck_table(s):
+    '''
+    returns a table of powerlaw Seebeck coefficients (increasing) with the
+    corresponding reduced chemical potentials and conductivities for unit
+    sigma_E_0. tables are built once per s. the table spans cp from -100
+    (about 9 mV/K) to 1e3 (about 0.3 uV/K for s=1, 30 for s=0), and Seebeck
+    coefficients outside of it give nan
+
+    Args:
+      s (int|half-integer) assumption of transport exponent (mechanism)
+
+    Returns: (touple) arrays of Seebeck, reduced potential, and conductivity
+    '''
+    if s not in _seebeck_tables:
+        cp_grid = np.linspace(-100., 30., 17800)
+        if s != 0:
+            # the degenerate limit falls off as 1/cp, so a geometric grid
+            # keeps the relative spacing small. s=0 decays exponentially and
+            # loses precision to cancellation beyond cp=30 (already ~1e-16)
+            cp_grid = np.concatenate(
+                (cp_grid, np.geomspace(30., 1e3, 512)[1:]))
+        cp_grid = cp_grid[::-1]
+        # seebeck decreases with cp, np.interp requires increasing x-points
+        _seebeck_tables[s] = (powerlaw_seebeck(cp_grid, s), cp_grid,
+                              powerlaw_conductivity(cp_grid, s, 1.))
+    return _seebeck_tables[s]
 
 
 def extract_transport_function(seebeck, conductivity, temperature, s=1):
@@ -22,20 +48,19 @@ def extract_transport_function(seebeck, conductivity, temperature, s=1):
     deformation potential scattering and band transport
 
     Args:
-      seebeck (float) the Seebeck coefficient, V/K
-      conductivity (float) electrical conductivity, S/m
-      temperature (float) the absolute temperature, K
+      seebeck (float|ndarray) the Seebeck coefficient, V/K
+      conductivity (float|ndarray) electrical conductivity, S/m
+      temperature (float|ndarray) the absolute temperature, K
       s (int|half-integer) assumption of transport exponent (mechanism)
 
 
-    Returns: (float) the transport function prefactor sigma_E_0, S/m
+    Returns: (float|ndarray) the transport function prefactor sigma_E_0, S/m
     '''
-    cp = minimize(
-        lambda cp: np.abs(powerlaw_seebeck(cp, s) - np.abs(seebeck)),
-        method='Nelder-Mead', x0=[0.]).x[0]
-    return minimize(lambda sigma_E_0: np.abs(
-        powerlaw_conductivity(cp, s, sigma_E_0) - conductivity),
-        method='Nelder-Mead', x0=[0.]).x[0]
+    seebeck_grid, _, conductivity_grid = _seebeck_table(s)
+    # conductivity is linear in sigma_E_0
+    return np.asarray(conductivity) / np.interp(
+        np.abs(seebeck), seebeck_grid, conductivity_grid,
+        left=np.nan, right=np.nan)
 
 
 def extract_effective_mass(seebeck, carrier_density, temperature):
@@ -45,16 +70,17 @@ def extract_effective_mass(seebeck, carrier_density, temperature):
     1 in this analysis, which indicates deformation potential scattering
 
     Args:
-      seebeck (float) the Seebeck coefficient, V/K
-      carrier_density (float) the carrier density, 1/m^3
-      temperature (float) the absolute temperature, K
+      seebeck (float|ndarray) the Seebeck coefficient, V/K
+      carrier_density (float|ndarray) the carrier density, 1/m^3
+      temperature (float|ndarray) the absolute temperature, K
 
 
-    Returns: (float) the effective mass m*, m_e
+    Returns: (float|ndarray) the effective mass m*, m_e
     '''
-    cp = minimize(
-        lambda cp: np.abs(sphere_seebeck(cp) - np.abs(seebeck)),
-        method='Nelder-Mead', x0=[0.]).x[0]
-    return minimize(lambda mstar: np.abs(
-        sphere_carriers(cp, temperature, mstar * _m_e) - carrier_density),
-        method='Nelder-Mead', x0=[0.]).x[0]
+    # the sphere Seebeck coefficient is the powerlaw Seebeck with s=1
+    seebeck_grid, cp_grid, _ = _seebeck_table(1)
+    cp = np.interp(np.abs(seebeck), seebeck_grid, cp_grid,
+                   left=np.nan, right=np.nan)
+    # carrier density scales with mstar ** 1.5
+    return (carrier_density /
+            sphere_carriers(cp, temperature, _m_e)) ** (2. / 3.)
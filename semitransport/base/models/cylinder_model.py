@@ -1,5 +1,7 @@
 from fdint import fdk  # function that implements Fermi-Dirac integrals
 
+from semitransport.base.models.sphere_model import sphere_seebeck
+
 
 '''
 this module implements basic functions for transport coefficients, which are
@@ -17,34 +19,33 @@ constant = {'e': 1.60217662e-19,  # physical constants
             'm_e': 9.10938356e-31,
             'pi': 3.14159265,
             'hbar': 1.054571800e-34}
+_dos_prefactor = (constant['m_e'] /
+                  (4. * constant['pi'] ** 2. * constant['hbar'] ** 2.))
+_carriers_prefactor = (constant['k'] /
+                       (2. * constant['pi']**2. * constant['hbar']**2.))
+_conductivity_prefactor = constant['e']**2. * _carriers_prefactor
 
 
 def cylinder_dos(mstar, l):
     '''density of states (1/Jm3)'''
 
-    return (l * mstar * constant['m_e'] /
-            (4. * constant['pi'] ** 2. * constant['hbar'] ** 2.))
+    return _dos_prefactor * l * mstar
 
 
 def cylinder_carriers(cp, T, mstar, l):
     '''carrier concentration (1/m3)'''
 
-    return fdk(0, cp) * (l * mstar / 2. / constant['pi']**2. /
-                         constant['hbar']**2. * constant['k'] * T)
+    return _carriers_prefactor * fdk(0, cp) * l * mstar * T
 
 
 def cylinder_conductivity(cp, T, tau_0, l):
     '''electrical conductivity (S/m)'''
 
-    return (constant['e']**2. * l / 2. / constant['pi']**2. /
-            constant['hbar']**2. * constant['k'] * T * tau_0 * fdk(0, cp))
+    return _conductivity_prefactor * l * T * tau_0 * fdk(0, cp)
 
 
 def cylinder_seebeck(cp):
     '''seebeck coefficient (V/K)'''
 
-    try:
-        return (constant['k'] / constant['e']) * (2.0 * fdk(1, cp) /
-                                                  fdk(0, cp) - cp)
-    except ValueError:
-        return 0.
+    # the seebeck coefficient has the same form as the spherical pocket
+    return sphere_seebeck(cp)
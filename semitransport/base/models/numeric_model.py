@@ -13,6 +13,31 @@ Model variables:
 
 constant = {'e': 1.60217662e-19,  # physical constants
             'k': 1.38064852e-23}
+_k_over_e = constant['k'] / constant['e']
+# np.trapz was renamed to np.trapezoid in numpy 2.0 and later removed
+_trapz = getattr(np, 'trapezoid', None) or np.trapz
+
+
+def _weighted_sigma_E(energy, sigma_E, mu, T):
+    '''
+    returns sigma_E weighted by the negative derivative of the Fermi-Dirac
+    distribution and the reduced energy beta * (energy - mu), so that both are
+    computed once for all of the transport integrals
+
+    Args:
+      energy: (ndarray) The x-points for sigma_E v.s. energy (units of eV).
+      sigma_E: (ndarray) The y-points for sigma_E v.s. energy (units of S/m).
+      mu: (float) The electron chemical potential (units of eV).
+      T: (float) The absolute temperature (units of K).
+
+    Returns: (touple of ndarrays)
+    '''
+
+    beta = 1. / _k_over_e / T  # units of 1/eV
+    reduced_energy = beta * (energy - mu)
+    fermi_dirac = 1. / (np.exp(reduced_energy) + 1.)
+    # the negative derivative of fermi-dirac is beta * f * (1 - f)
+    return (sigma_E * beta * fermi_dirac * (1. - fermi_dirac), reduced_energy)
 
 
 def numeric_conductivity(energy, sigma_E, mu, T):
@@ -28,13 +53,8 @@ def numeric_conductivity(energy, sigma_E, mu, T):
     Returns: (float)
     '''
 
-    beta = 1. / constant['k'] / T * constant['e']  # units of eV
-    derivative_of_fermi_dirac = -(
-        beta * np.exp(beta * (energy - mu)) / (
-            np.exp(beta * (energy - mu)) + 1.)**2.)
-    return np.trapz(
-        y=sigma_E * (-derivative_of_fermi_dirac),
-        x=energy)
+    weighted_sigma_E, _ = _weighted_sigma_E(energy, sigma_E, mu, T)
+    return _trapz(y=weighted_sigma_E, x=energy)
 
 
 def numeric_nu(energy, sigma_E, mu, T):
@@ -50,14 +70,30 @@ def numeric_nu(energy, sigma_E, mu, T):
     Returns: (float)
     '''
 
-    beta = 1. / constant['k'] / T * constant['e']  # units of eV
-    derivative_of_fermi_dirac = -(
-        beta * np.exp(beta * (energy - mu)) / (
-            np.exp(beta * (energy - mu)) + 1.)**2.)
-    return np.trapz(
-        y=(constant['k'] / constant['e'] * sigma_E *
-           (-derivative_of_fermi_dirac) * (energy - mu) * beta),
-        x=energy)
+    weighted_sigma_E, reduced_energy = _weighted_sigma_E(
+        energy, sigma_E, mu, T)
+    return _trapz(y=_k_over_e * weighted_sigma_E * reduced_energy, x=energy)
+
+
+def _numeric_conductivity_and_nu(energy, sigma_E, mu, T):
+    '''
+    returns the electrical conductivity (S/m) and the transport coefficient for
+    a temperature gradient from a single evaluation of the Fermi-Dirac weights
+
+    Args:
+      energy: (ndarray) The x-points for sigma_E v.s. energy (units of eV).
+      sigma_E: (ndarray) The y-points for sigma_E v.s. energy (units of S/m).
+      mu: (float) The electron chemical potential (units of eV).
+      T: (float) The absolute temperature (units of K).
+
+    Returns: (touple of floats)
+    '''
+
+    weighted_sigma_E, reduced_energy = _weighted_sigma_E(
+        energy, sigma_E, mu, T)
+    return (_trapz(y=weighted_sigma_E, x=energy),
+            _trapz(y=_k_over_e * weighted_sigma_E * reduced_energy,
+                   x=energy))
 
 
 def numeric_seebeck(energy, sigma_E, mu, T):
@@ -73,5 +109,5 @@ def numeric_seebeck(energy, sigma_E, mu, T):
     Returns: (float)
     '''
 
-    return (numeric_nu(energy, sigma_E, mu, T) /
-            numeric_conductivity(energy, sigma_E, mu, T))
+    conductivity, nu = _numeric_conductivity_and_nu(energy, sigma_E, mu, T)
+    return nu / conductivity
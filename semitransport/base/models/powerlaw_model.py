@@ -15,6 +15,7 @@ Model variables:
 
 constant = {'e': 1.60217662e-19,  # physical constants
             'k': 1.38064852e-23}
+_k_over_e = constant['k'] / constant['e']
 
 
 def powerlaw_conductivity(cp, s, sigma_E_0):
@@ -47,8 +48,6 @@ def powerlaw_seebeck(cp, s):
     '''
 
     if s == 0:  # s=0 requires analytic simplification
-        return constant['k'] / constant['e'] * (((1. + np.exp(-cp)) *
-                                                 fdk(0, cp)) - cp)
+        return _k_over_e * (((1. + np.exp(-cp)) * fdk(0, cp)) - cp)
     else:
-        return constant['k'] / constant['e'] * (((s + 1.) * fdk(s, cp) / s /
-                                                 fdk(s - 1, cp)) - cp)
+        return _k_over_e * (((s + 1.) * fdk(s, cp) / s / fdk(s - 1, cp)) - cp)
@@ -1,5 +1,7 @@
 from fdint import fdk  # function that implements Fermi-Dirac integrals
 
+import numpy as np
+
 
 '''
 this module implements basic functions for transport coefficients, which are
@@ -18,36 +20,40 @@ constant = {'e': 1.60217662e-19,  # physical constants
             'pi': 3.14159265,
             'h': 6.62607004e-34,
             'hbar': 1.054571800e-34}
+_k_over_e = constant['k'] / constant['e']
+_dos_prefactor = ((2. * constant['m_e']) ** 1.5 /
+                  (2. * constant['pi']**2. * constant['hbar'] ** 3.))
+_carriers_prefactor = (4. * constant['pi'] *
+                       (2. * constant['k'] / constant['h']**2.) ** 1.5)
+_conductivity_prefactor = (8. * constant['pi'] * constant['e'] ** 2. *
+                           (2. * constant['k']) ** 1.5 / 3. /
+                           constant['h']**3.)
 
 
 def sphere_dos(mstar, energy):
     '''density of states (1/Jm3)'''
 
-    return ((2. * mstar * constant['m_e']) ** 1.5 * energy ** 0.5 /
-            (2. * constant['pi']**2. * constant['hbar'] ** 3.))
+    return _dos_prefactor * mstar ** 1.5 * energy ** 0.5
 
 
 def sphere_carriers(cp, T, mstar):
     '''carrier concentration (1/m3)'''
 
-    return fdk(0.5, cp) * (4. * constant['pi'] *
-                           (2. * mstar * constant['k'] * T /
-                            constant['h']**2.) ** 1.5)
+    return _carriers_prefactor * fdk(0.5, cp) * (mstar * T) ** 1.5
 
 
 def sphere_conductivity(cp, T, tau_0, mstar):
     '''electrical conductivity (S/m)'''
 
-    return (tau_0 * fdk(0, cp) * 8. * constant['pi'] *
-            mstar ** 0.5 * constant['e'] ** 2. *
-            (2. * constant['k'] * T) ** 1.5 / 3. / constant['h']**3.)
+    return (_conductivity_prefactor * tau_0 * fdk(0, cp) *
+            mstar ** 0.5 * T ** 1.5)
 
 
 def sphere_seebeck(cp):
     '''seebeck coeficient (V/K)'''
 
-    try:
-        return (constant['k'] / constant['e']) * (2.0 * fdk(1, cp) /
-                                                  fdk(0, cp) - cp)
-    except ValueError:
-        return 0.
+    f0 = fdk(0, cp)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        seebeck = _k_over_e * (2.0 * fdk(1, cp) / f0 - cp)
+    # a vanishing fdk(0, cp) gives 0 rather than inf/nan
+    return np.where(f0 != 0., seebeck, 0.)[()]
@@ -9,5 +9,5 @@ setup(name='semitransport',
       author='Maxwell Dylla',
       license='MIT',
       packages=find_packages(),
-      install_requires=['numpy', 'scipy', 'fdint'],
+      install_requires=['numpy', 'fdint'],
       long_description=open('README.md').read())
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('fdint')
+
+from semitransport.base.analysis.samples import SampleSeries  # noqa: E402
+from semitransport.base.analysis.transport_coefficients import\
+    extract_transport_function, extract_effective_mass  # noqa: E402
+
+
+# reference values from the original Nelder-Mead implementation
+@pytest.mark.parametrize('seebeck, s, expected', [
+    (5e-6, 1, 1763.68),
+    (8e-6, 1, 2821.88),
+    (150e-6, 1, 75339.5),
+    (5e-6, 0, 101041.8),
+    (150e-6, 0, 261728.7),
+])
+def test_extract_transport_function(seebeck, s, expected):
+    assert extract_transport_function(seebeck, 1e5, 300., s) == \
+        pytest.approx(expected, rel=1e-4)
+
+
+def test_extract_transport_function_degenerate_and_sign():
+    # |S| below 10 uV/K is common for heavily doped samples
+    sigma_E_0 = extract_transport_function(
+        np.array([-2e-6, 5e-6, 9e-6]), 1e5, 300.)
+    assert np.all(np.isfinite(sigma_E_0))
+    assert np.all(np.diff(sigma_E_0) > 0)
+
+
+@pytest.mark.parametrize('seebeck, carrier_density, expected', [
+    (5e-6, 1e28, 1.15439),
+    (150e-6, 1e26, 1.84092),
+])
+def test_extract_effective_mass(seebeck, carrier_density, expected):
+    assert extract_effective_mass(seebeck, carrier_density, 300.) == \
+        pytest.approx(expected, rel=1e-4)
+
+
+def test_jonker_analysis_degenerate_sample():
+    means, mins, maxes = SampleSeries.jonker_analysis(
+        [5e-6, 150e-6], [1e5, 1e5], 300.)
+    assert np.isfinite([means, mins, maxes]).all()
+    assert mins == pytest.approx(1763.68, rel=1e-4)
+    assert maxes == pytest.approx(75339.5, rel=1e-4)